@@ -17,73 +17,265 @@ Tables page.
 
 from __future__ import annotations
 
+import io
 import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Dict, Any
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Dict, Any, List, Tuple
 
+import numpy as np
 import pandas as pd
-import pydeck as pdk
 import streamlit as st
 
-from duchenne_toolkit.src.utils.github import (
-    create_branch,
-    commit_file,
-    open_pr,
-)
+# pydeck and the GitHub helpers (which pull in requests) are imported where
+# they're used, so a cold start doesn't pay for them before first paint.
+if TYPE_CHECKING:
+    import pydeck as pdk
+
 from duchenne_toolkit.src.utils.validate import (
-    validate_fips,
-    coerce_distance_band,
+    validate_fips_series,
+    coerce_distance_band_series,
     show_validation_report,
 )
-from duchenne_toolkit.src.data.loaders import load_coverage
+from duchenne_toolkit.src.data.loaders import (
+    COVERAGE_DTYPES,
+    load_centers,
+    load_coverage,
+    read_typed_csv,
+)
 
 # Configure the page
 st.set_page_config(page_title="DMD Access Coverage", layout="wide")
 
 # Directory for final data
 DATA_DIR = Path("duchenne_toolkit/data_final")
+CENTERS_CSV = DATA_DIR / "centers_cdcc_us.csv"
+COVERAGE_CSV = DATA_DIR / "county_coverage.csv"
+
+# Distance bands in display order; "Unknown" is what coverage.py writes for
+# counties without a distance.
+BAND_DTYPE = pd.CategoricalDtype(["<=150", "150_300", ">300", "Unknown"])
+
+# Numeric coverage columns held as float32 in memory
+FLOAT32_COLS = (
+    "lat",
+    "lon",
+    "modeled_dmd_5_24_low",
+    "modeled_dmd_5_24_mid",
+    "modeled_dmd_5_24_high",
+    "great_circle_mi",
+)
 
 # ---- Secrets (GitHub integration) --------------------------------------------
 
-secrets = st.secrets if hasattr(st, "secrets") else {}
-repo_full_name = None
-base_branch = None
-token = secrets.get("github_token")
+@st.cache_resource(show_spinner=False)
+def _gh_config() -> SimpleNamespace:
+    """Resolve the GitHub settings from Streamlit secrets once per process."""
+    secrets = st.secrets if hasattr(st, "secrets") else {}
+    repo_full_name = None
+    base_branch = None
+    token = secrets.get("github_token")
 
-if "github_repo" in secrets:
-    repo_full_name = secrets.get("github_repo")
-    base_branch = secrets.get("github_default_branch") or secrets.get("github_branch")
-else:
-    owner = secrets.get("github_repo_owner")
-    name = secrets.get("github_repo_name")
-    if owner and name:
-        repo_full_name = f"{owner}/{name}"
-    base_branch = secrets.get("github_branch") or secrets.get("github_default_branch")
-
-required = {"repo": bool(repo_full_name), "token": bool(token), "branch": bool(base_branch)}
-missing_secrets = []
-if not required["repo"]:
-    missing_secrets.append("github_repo (or github_repo_owner + github_repo_name)")
-if not required["token"]:
-    missing_secrets.append("github_token")
-if not required["branch"]:
-    missing_secrets.append("github_default_branch (or github_branch)")
+    if "github_repo" in secrets:
+        repo_full_name = secrets.get("github_repo")
+        base_branch = secrets.get("github_default_branch") or secrets.get("github_branch")
+    else:
+        owner = secrets.get("github_repo_owner")
+        name = secrets.get("github_repo_name")
+        if owner and name:
+            repo_full_name = f"{owner}/{name}"
+        base_branch = secrets.get("github_branch") or secrets.get("github_default_branch")
+
+    missing = []
+    if not repo_full_name:
+        missing.append("github_repo (or github_repo_owner + github_repo_name)")
+    if not token:
+        missing.append("github_token")
+    if not base_branch:
+        missing.append("github_default_branch (or github_branch)")
+    return SimpleNamespace(
+        repo_full_name=repo_full_name, base_branch=base_branch, token=token, missing=missing
+    )
+
+
+cfg = _gh_config()
 
 # ---- Data loading ------------------------------------------------------------
 
+# Not cached itself: _bootstrap below holds the result, and a second cache
+# layer here would keep another copy of every frame.
+def _load_cov() -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    cov, debug = load_coverage()
+    # Coerce once here so the min-cases filter is a plain comparison.  float32
+    # is plenty for these and halves the memory every filter pass scans.
+    # load_coverage already types most of them (lat/lon included), so only
+    # columns that arrive as text need a to_numeric pass.
+    for c in FLOAT32_COLS:
+        if c in cov.columns:
+            col = cov[c]
+            if not pd.api.types.is_numeric_dtype(col):
+                col = pd.to_numeric(col, errors="coerce")
+            cov[c] = col.astype("float32")
+    # Low-cardinality keys as categoricals: isin/map work on integer codes.
+    if "band_miles" in cov.columns:
+        cov["band_miles"] = cov["band_miles"].astype(BAND_DTYPE)
+    if "state_fips" in cov.columns:
+        cov["state_fips"] = cov["state_fips"].astype("category")
+    return cov, debug
+
+
+# Bounded: each saved edit changes the mtime key and would otherwise leave the
+# previous version's entry behind.
+@st.cache_data(show_spinner=False, ttl=24 * 60 * 60, max_entries=8)
+def _load_editable(path: Path, mtime: float) -> pd.DataFrame:
+    # mtime is only part of the cache key, so a rewritten file is re-read.
+    # Only the FIPS columns are typed: the frame is written back verbatim.
+    fips_dtypes = {c: COVERAGE_DTYPES[c] for c in ("state_fips", "county_fips")}
+    return read_typed_csv(path, fips_dtypes)
+
+
+def _to_csv_bytes(df: pd.DataFrame) -> bytes:
+    # Encode while writing rather than building a str and re-encoding it.
+    buf = io.BytesIO()
+    df.to_csv(buf, index=False, encoding="utf-8")
+    return buf.getvalue()
+
+
+@st.cache_data(show_spinner=False, ttl=24 * 60 * 60, max_entries=8)
+def _row_hashes(path: Path, mtime: float) -> np.ndarray:
+    # One 64-bit hash per row of the file as loaded, for change detection.
+    return pd.util.hash_pandas_object(_load_editable(path, mtime), index=False).to_numpy()
+
+
+def _state_options(cov: pd.DataFrame) -> List[str]:
+    return sorted(cov["state_fips"].dropna().unique().tolist()) if "state_fips" in cov.columns else []
+
+
+def _centers_vis(centers: pd.DataFrame) -> pd.DataFrame:
+    # Plottable centres, projected to the positions plus the centre's name.
+    if not {"lat", "lon"}.issubset(centers.columns):
+        return pd.DataFrame()
+    cols = [c for c in ("lon", "lat", "center_name") if c in centers.columns]
+    vis = centers.loc[centers["lat"].notna() & centers["lon"].notna(), cols]
+    # As in _build_map_frame: float32 positions would serialise with spurious
+    # digits, so they go out as float64 rounded to 5 decimals (~1 m).
+    return vis.assign(**{c: vis[c].astype("float64").round(5) for c in ("lon", "lat")})
+
+
+# Fill colour per BAND_DTYPE code as separate uint8 channels; the last row
+# doubles as the fallback for missing bands.
+_BAND_COLORS = np.array(
+    [[34, 197, 94], [245, 158, 11], [239, 68, 68], [120, 144, 156]], dtype=np.uint8
+)
+
+# Columns read by the county ScatterplotLayer accessors and its tooltip
+MAP_LAYER_COLS = [
+    "lon",
+    "lat",
+    "r",
+    "g",
+    "b",
+    "radius",
+    "county_name",
+    "band_miles",
+    "modeled_dmd_5_24_mid",
+    "nearest_center_name",
+    "great_circle_mi",
+]
+
+# Tooltip for the county layer; the fields are MAP_LAYER_COLS columns
+COUNTY_TOOLTIP = (
+    "County: {county_name}\\nBand: {band_miles}\\nCases (5–24 mid): {modeled_dmd_5_24_mid}"
+    "\\nNearest center: {nearest_center_name}\\nDistance (mi): {great_circle_mi}"
+)
+
+
+def _build_map_frame(cov: pd.DataFrame) -> pd.DataFrame:
+    """Per-county map layer rows: colour, radius and tooltip values, derived once at load."""
+    map_df = cov.dropna(subset=["lat", "lon"])
+    if "band_miles" in map_df.columns:
+        codes = map_df["band_miles"].cat.codes.to_numpy()
+        band = np.where(codes < 0, 3, codes)
+    else:
+        band = np.full(len(map_df), 3, dtype=np.int8)
+    rgb = np.take(_BAND_COLORS, band, axis=0)
+    if "modeled_dmd_5_24_mid" in map_df.columns:
+        # Already numeric: _load_cov coerces it once at load.  nan_to_num
+        # returns a fresh array (the column may share memory with cov), so the
+        # rest of the arithmetic can run in place.
+        radius = np.nan_to_num(map_df["modeled_dmd_5_24_mid"].to_numpy(dtype=np.float32), nan=0.0)
+        np.maximum(radius, 0, out=radius)
+        radius *= 1500
+        radius += 5000
+    else:
+        radius = 5000
+    # float32 values serialise with spurious digits (0.6000000238), which would
+    # show up in the tooltip, so the displayed numbers go out as rounded float64.
+    tooltip_nums = {
+        c: map_df[c].astype("float64").round(3)
+        for c in ("modeled_dmd_5_24_mid", "great_circle_mi")
+        if c in map_df.columns
+    }
+    # st.pydeck_chart ships layer data as JSON text, so every digit is payload:
+    # positions go out at 5 decimals (~1 m) and radii as whole metres.
+    positions = {c: map_df[c].astype("float64").round(5) for c in ("lon", "lat")}
+    radius = np.rint(radius).astype(np.int32)
+    map_df = map_df.assign(
+        r=rgb[:, 0], g=rgb[:, 1], b=rgb[:, 2], radius=radius, **positions, **tooltip_nums
+    )
+    # Only the columns the layer and tooltip reference are shipped to the browser.
+    return map_df[[c for c in MAP_LAYER_COLS if c in map_df.columns]]
+
+
+@st.cache_resource(show_spinner=False, ttl=24 * 60 * 60, max_entries=1)
+def _bootstrap(centers_mtime: float, cov_mtime: float) -> SimpleNamespace:
+    """Load the frames plus everything derived from them, once per file version.
+
+    This is the only in-memory cache of the frames: widget interactions (which
+    rerun the whole script) reuse it, and the mtime arguments, only cache keys,
+    make a rewritten CSV load afresh.  cache_resource hands every rerun the
+    same objects, so callers must treat ``centers`` and ``cov`` as read-only.
+    """
+    centers = load_centers(CENTERS_CSV)
+    cov, debug = _load_cov()
+    has_lat_lon = {"lat", "lon"}.issubset(cov.columns)
+    return SimpleNamespace(
+        centers=centers,
+        centers_vis=_centers_vis(centers),
+        cov=cov,
+        debug=debug,
+        has_lat_lon=has_lat_lon,
+        map_base=_build_map_frame(cov) if has_lat_lon else pd.DataFrame(),
+        map_tooltip=COUNTY_TOOLTIP if "county_name" in cov.columns else "DMD coverage",
+        states=_state_options(cov),
+        # Overview stats don't depend on the filters
+        with_coords=int((cov["lat"].notna() & cov["lon"].notna()).sum()) if has_lat_lon else 0,
+    )
+
+
 with st.spinner("Loading data…"):
     try:
-        centers = pd.read_csv(DATA_DIR / "centers_cdcc_us.csv", dtype={"state": str}, low_memory=False)
-        cov, load_debug = load_coverage()
+        centers_version = CENTERS_CSV.stat().st_mtime
+        cov_version = COVERAGE_CSV.stat().st_mtime
+        B = _bootstrap(centers_version, cov_version)
+        centers, centers_vis, cov, load_debug = B.centers, B.centers_vis, B.cov, B.debug
+        has_lat_lon: bool = B.has_lat_lon
+        states = B.states
+        map_base, map_tooltip = B.map_base, B.map_tooltip
+        with_coords = B.with_coords
     except Exception as exc:
         st.error(f"Failed to load data: {exc}")
-        centers, cov = pd.DataFrame(), pd.DataFrame()
+        centers, centers_vis, cov = pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
+        map_base, map_tooltip = pd.DataFrame(), ""
+        centers_version = cov_version = None
         load_debug: Dict[str, Any] = {}
-
-has_lat_lon: bool = {"lat", "lon"}.issubset(cov.columns)
+        has_lat_lon = False
+        states = []
+        with_coords = 0
 
 # Sidebar filters
-states = sorted(cov["state_fips"].dropna().unique()) if "state_fips" in cov.columns else []
 if "state_pick" not in st.session_state:
     st.session_state["state_pick"] = states or []
 if "band_pick" not in st.session_state:
@@ -91,7 +283,8 @@ if "band_pick" not in st.session_state:
 if "min_cases" not in st.session_state:
     st.session_state["min_cases"] = 0.0
 
-with st.sidebar:
+# Filters live in a form so edits only trigger a rerun when "Apply" is pressed.
+with st.sidebar, st.form("filters"):
     st.header("Filters")
     st.session_state["state_pick"] = st.multiselect(
         "States (FIPS)", options=states, default=st.session_state["state_pick"]
@@ -104,18 +297,112 @@ with st.sidebar:
     st.session_state["min_cases"] = st.number_input(
         "Min modeled cases (5–24)", min_value=0.0, value=float(st.session_state["min_cases"])
     )
+    st.form_submit_button("Apply")
 
-if not cov.empty:
-    mask = pd.Series(True, index=cov.index)
-    if st.session_state["state_pick"]:
-        mask &= cov["state_fips"].isin(st.session_state["state_pick"])
-    if st.session_state["band_pick"]:
-        mask &= cov["band_miles"].isin(st.session_state["band_pick"])
+# Outside the form: switching the map view needs no "Apply".
+st.sidebar.checkbox(
+    "Aggregate map (hexagons)",
+    key="map_aggregate",
+    help="Sum modeled cases into hexagon cells instead of drawing one point per county.",
+)
+
+
+def _filter_cov(
+    cov: pd.DataFrame,
+    states: Tuple[str, ...],
+    bands: Tuple[str, ...],
+    min_cases: float,
+) -> pd.DataFrame:
+    conds = []
+    if states:
+        conds.append(cov["state_fips"].isin(states).to_numpy())
+    if bands:
+        conds.append(cov["band_miles"].isin(bands).to_numpy())
     if "modeled_dmd_5_24_mid" in cov.columns:
-        mask &= pd.to_numeric(cov["modeled_dmd_5_24_mid"], errors="coerce").fillna(0) >= st.session_state["min_cases"]
-    cov_f = cov.loc[mask].copy()
-else:
+        mid = cov["modeled_dmd_5_24_mid"].to_numpy()
+        # Missing counts as 0 cases, so it only passes a zero threshold.
+        conds.append(mid >= min_cases if min_cases > 0 else ~(mid < 0))
+    mask = np.logical_and.reduce(conds) if conds else np.ones(len(cov), dtype=bool)
+    return cov.loc[mask]
+
+
+filters = (
+    tuple(sorted(st.session_state["state_pick"])),
+    tuple(sorted(st.session_state["band_pick"])),
+    float(st.session_state["min_cases"]),
+)
+# Not cached across sessions: the key space (any min_cases float) is
+# unbounded.  Reruns from other widgets reuse this session's last view, keyed
+# on the coverage file version as well as the filters.
+applied = (cov_version,) + filters
+if cov.empty:
     cov_f = cov
+elif st.session_state.get("_applied_filters") == applied:
+    cov_f = st.session_state["_cov_f"]
+else:
+    cov_f = _filter_cov(cov, *filters)
+    st.session_state["_applied_filters"] = applied
+    st.session_state["_cov_f"] = cov_f
+
+def _make_deck(
+    cov_f: pd.DataFrame,
+    map_base: pd.DataFrame,
+    tooltip: str,
+    centers_vis: pd.DataFrame,
+    view_state: Any,
+    aggregate: bool = False,
+) -> "pdk.Deck":
+    import pydeck as pdk
+
+    # The per-row map columns are precomputed; the filter only selects rows.
+    layer_df = map_base[map_base.index.isin(cov_f.index)]
+
+    if aggregate and "modeled_dmd_5_24_mid" in layer_df.columns:
+        # Modeled cases summed into hexagon cells: a few hundred cells
+        # instead of one overlapping point per county at national zoom.
+        county_layer = pdk.Layer(
+            "HexagonLayer",
+            data=layer_df[["lon", "lat", "modeled_dmd_5_24_mid"]],
+            get_position=["lon", "lat"],
+            get_elevation_weight="modeled_dmd_5_24_mid",
+            get_color_weight="modeled_dmd_5_24_mid",
+            elevation_aggregation="SUM",
+            color_aggregation="SUM",
+            radius=30000,
+            elevation_scale=20,
+            extruded=True,
+            pickable=True,
+        )
+        tooltip = "Cases (5–24 mid): {elevationValue}"
+    else:
+        county_layer = pdk.Layer(
+            "ScatterplotLayer",
+            data=layer_df,
+            get_position=["lon", "lat"],
+            get_radius="radius",
+            get_fill_color=["r", "g", "b"],
+            pickable=True,
+        )
+    center_layer = (
+        pdk.Layer(
+            "ScatterplotLayer",
+            data=centers_vis,
+            get_position=["lon", "lat"],
+            get_radius=6000,
+            get_fill_color=[30, 64, 175],
+            pickable=True,
+        )
+        if not centers_vis.empty
+        else None
+    )
+    layers = [county_layer] + ([center_layer] if center_layer is not None else [])
+    return pdk.Deck(
+        layers=layers,
+        initial_view_state=view_state or pdk.ViewState(latitude=39.5, longitude=-98.35, zoom=3.4),
+        map_style=None,
+        tooltip={"text": tooltip},
+    )
+
 
 # ---- Layout ------------------------------------------------------------------
 
@@ -130,7 +417,6 @@ with overview_tab:
     st.subheader("Quick stats")
     if not cov.empty:
         total_counties = len(cov)
-        with_coords = int((cov[["lat", "lon"]].notna().all(axis=1)).sum()) if {"lat", "lon"}.issubset(cov.columns) else 0
         st.metric("Counties in model", total_counties)
         st.metric("Counties with coordinates", with_coords)
         st.caption(f"Derived at: {load_debug.get('derived_path', 'n/a')}")
@@ -144,63 +430,30 @@ with map_tab:
             "Coverage lacks coordinates. Check `county_coverage.csv` or the derived file in `duchenne_toolkit/data/derived`."
         )
     else:
-        map_df = cov_f.dropna(subset=["lat", "lon"]).copy()
-        color_map = {"<=150": [34, 197, 94], "150_300": [245, 158, 11], ">300": [239, 68, 68]}
-        if "band_miles" in map_df.columns:
-            map_df["color"] = map_df["band_miles"].map(color_map).fillna([120, 144, 156])
+        view_state = st.session_state.get("map_view_state")
+        # Reruns that leave the data, filters and view alone reuse the last
+        # deck instead of rebuilding the frame and layers.  Reuse also keeps
+        # the layer ids stable, so the browser doesn't recreate the layers.
+        aggregate = st.session_state.get("map_aggregate", False)
+        map_sig = (applied, centers_version, view_state, aggregate)
+        cached_deck = st.session_state.get("_map_deck")
+        if cached_deck is not None and cached_deck[0] == map_sig:
+            deck = cached_deck[1]
         else:
-            map_df["color"] = [120, 144, 156]
-        if "modeled_dmd_5_24_mid" in map_df.columns:
-            map_df["radius"] = pd.to_numeric(map_df["modeled_dmd_5_24_mid"], errors="coerce").fillna(0).clip(lower=0) * 1500 + 5000
+            deck = _make_deck(cov_f, map_base, map_tooltip, centers_vis, view_state, aggregate)
+            st.session_state["_map_deck"] = (map_sig, deck)
+        st.pydeck_chart(deck)
+        if aggregate:
+            st.caption("Hexagon height and colour: modeled cases (5–24 mid) summed per cell.")
         else:
-            map_df["radius"] = 5000
-
-        county_layer = pdk.Layer(
-            "ScatterplotLayer",
-            data=map_df,
-            get_position=["lon", "lat"],
-            get_radius="radius",
-            get_fill_color="color",
-            pickable=True,
-        )
-        centers_vis = centers.dropna(subset=["lat", "lon"]) if {"lat", "lon"}.issubset(centers.columns) else pd.DataFrame()
-        center_layer = (
-            pdk.Layer(
-                "ScatterplotLayer",
-                data=centers_vis,
-                get_position=["lon", "lat"],
-                get_radius=6000,
-                get_fill_color=[30, 64, 175],
-                pickable=True,
-            )
-            if not centers_vis.empty
-            else None
-        )
-        layers = [county_layer] + ([center_layer] if center_layer is not None else [])
-        tooltip_txt = (
-            "County: {county_name}\\nBand: {band_miles}\\nCases (5–24 mid): {modeled_dmd_5_24_mid}\\nNearest center: {nearest_center_name}\\nDistance (mi): {great_circle_mi}"
-            if "county_name" in map_df.columns
-            else "DMD coverage"
-        )
-        view_state = st.session_state.get(
-            "map_view_state", pdk.ViewState(latitude=39.5, longitude=-98.35, zoom=3.4)
-        )
-        st.pydeck_chart(
-            pdk.Deck(
-                layers=layers,
-                initial_view_state=view_state,
-                map_style=None,
-                tooltip={"text": tooltip_txt},
+            st.markdown(
+                """
+                **Legend**  
+                • ≤150 miles (green)  
+                • 150–300 miles (orange)  
+                • >300 miles (red)
+                """
             )
-        )
-        st.markdown(
-            """
-            **Legend**  
-            • ≤150 miles (green)  
-            • 150–300 miles (orange)  
-            • >300 miles (red)
-            """
-        )
 
 # Tables
 with tables_tab:
@@ -226,89 +479,141 @@ with about_tab:
     )
 
 # Edit Data
-with edit_tab:
+# A fragment: editing cells reruns only this tab, not the loading, filtering
+# and map code above.
+@st.fragment
+def _edit_data() -> None:
     st.subheader("Edit CSVs")
     file_options = {
-        "county_coverage.csv": DATA_DIR / "county_coverage.csv",
-        "centers_cdcc_us.csv": DATA_DIR / "centers_cdcc_us.csv",
+        "county_coverage.csv": COVERAGE_CSV,
+        "centers_cdcc_us.csv": CENTERS_CSV,
     }
     file_name = st.selectbox("Choose a file to edit", list(file_options))
     path = file_options[file_name]
     if not path.exists():
         st.error(f"Missing file: {path}")
     else:
-        df = pd.read_csv(path)
+        df = _load_editable(path, path.stat().st_mtime)
         st.caption("Tip: double-click cells to edit; use the download below to save a copy.")
         edited = st.data_editor(df, use_container_width=True, num_rows="dynamic")
 
-        # Validation
-        report: Dict[str, Any] = {}
-        if "state_fips" in edited.columns:
-            bad = edited["state_fips"].astype(str).apply(validate_fips)
-            if (~bad).any():
-                report["invalid_state_fips"] = int((~bad).sum())
-        if "county_fips" in edited.columns:
-            bad = edited["county_fips"].astype(str).apply(validate_fips)
-            if (~bad).any():
-                report["invalid_county_fips"] = int((~bad).sum())
-        if "band_miles" in edited.columns:
-            edited["band_miles_norm"] = edited["band_miles"].apply(coerce_distance_band)
-            if edited["band_miles_norm"].isna().any():
-                report["invalid_band_miles"] = int(edited["band_miles_norm"].isna().sum())
-            else:
-                edited["band_miles"] = edited["band_miles_norm"]
-            edited = edited.drop(columns=["band_miles_norm"], errors="ignore")
-        for col in ["modeled_dmd_5_24_mid", "lat", "lon", "great_circle_mi"]:
-            if col in edited.columns:
-                coerced = pd.to_numeric(edited[col], errors="coerce")
-                n_nans = int(coerced.isna().sum()) - int(edited[col].isna().sum())
-                edited[col] = coerced
-                if n_nans > 0:
-                    report[f"non_numeric_{col}"] = n_nans
-
-        show_validation_report(report, st)
-
-        if report:
-            st.error("Validation failed; please fix the issues above and try again.")
+        # Row hashes of the file as loaded (cached with it); reused for the
+        # changed-rows diff.
+        h_old = _row_hashes(path, path.stat().st_mtime)
+        h_edit = pd.util.hash_pandas_object(edited, index=False).to_numpy()
+        unchanged = len(edited) == len(df) and np.array_equal(h_edit, h_old)
+        # Callables run only when the button is clicked, so reruns don't read
+        # or encode anything.  The shallow copy keeps the validation below
+        # from changing what gets downloaded.
+        st.download_button(
+            "Download CSV",
+            data=path.read_bytes if unchanged else partial(_to_csv_bytes, edited.copy(deep=False)),
+            file_name=file_name,
+            mime="text/csv",
+        )
+        if unchanged:
+            st.info("No changes detected.")
         else:
-            if missing_secrets:
-                st.warning(
-                    "Cannot create pull request because required secrets are missing: "
-                    f"{', '.join(missing_secrets)}"
-                )
+            # Validation
+            report: Dict[str, Any] = {}
+            if "state_fips" in edited.columns:
+                bad = ~validate_fips_series(edited["state_fips"])
+                if bad.any():
+                    report["invalid_state_fips"] = int(bad.sum())
+            if "county_fips" in edited.columns:
+                bad = ~validate_fips_series(edited["county_fips"])
+                if bad.any():
+                    report["invalid_county_fips"] = int(bad.sum())
+            if "band_miles" in edited.columns:
+                edited["band_miles_norm"] = coerce_distance_band_series(edited["band_miles"])
+                if edited["band_miles_norm"].isna().any():
+                    report["invalid_band_miles"] = int(edited["band_miles_norm"].isna().sum())
+                else:
+                    edited["band_miles"] = edited["band_miles_norm"]
+                edited = edited.drop(columns=["band_miles_norm"], errors="ignore")
+            # Columns that already parsed as numbers can't gain NaNs from coercion.
+            num_cols = [
+                c
+                for c in ["modeled_dmd_5_24_mid", "lat", "lon", "great_circle_mi"]
+                if c in edited.columns and not pd.api.types.is_numeric_dtype(edited[c])
+            ]
+            if num_cols:
+                before_na = edited[num_cols].isna().sum()
+                coerced = edited[num_cols].apply(pd.to_numeric, errors="coerce")
+                new_na = coerced.isna().sum() - before_na
+                edited[num_cols] = coerced
+                report.update({f"non_numeric_{c}": int(n) for c, n in new_na.items() if n > 0})
+
+            show_validation_report(report, st)
+
+            if report:
+                st.error("Validation failed; please fix the issues above and try again.")
             else:
-                try:
-                    repo_full_name_str: str = repo_full_name
-                    branch_name = f"data-update/{file_name.replace('.csv','')}-{pd.Timestamp.utcnow().strftime('%Y%m%d-%H%M%S')}"
-                    base = base_branch
-                    create_branch(repo_full_name_str, base, branch_name, token)
-                    csv_bytes = edited.to_csv(index=False).encode("utf-8")
-                    commit_file(
-                        repo_full_name_str,
-                        branch_name,
-                        f"duchenne_toolkit/data_final/{file_name}",
-                        csv_bytes,
-                        f"chore(data): update {file_name} via Streamlit",
-                        token,
+                if cfg.missing:
+                    st.warning(
+                        "Cannot create pull request because required secrets are missing: "
+                        f"{', '.join(cfg.missing)}"
                     )
-                    original = df.copy()
-                    diff_df = edited.merge(original, how="outer", indicator=True)
-                    st.expander("Preview: changed rows").dataframe(diff_df[diff_df["_merge"] != "both"], use_container_width=True)
-                    changelog = {
-                        "file": file_name,
-                        "rows_before": int(len(original)),
-                        "rows_after": int(len(edited)),
-                        "rows_modified": int(len(diff_df)) if not diff_df.empty else 0,
-                    }
-                    body = "Automated data update from Streamlit app.\\n\\n" + json.dumps(changelog, indent=2)
-                    pr_url = open_pr(
-                        repo_full_name_str,
-                        branch_name,
-                        base,
-                        f"feat(data): update {file_name} via app",
-                        body,
-                        token,
-                    )
-                    st.success(f"Pull request created: {pr_url}")
-                except Exception as exc:
-                    st.error(f"Failed to create pull request: {exc}")
+                else:
+                    try:
+                        from duchenne_toolkit.src.utils.github import (
+                            create_branch,
+                            commit_file,
+                            git_blob_sha,
+                            open_pr,
+                        )
+
+                        repo_full_name_str: str = cfg.repo_full_name
+                        branch_name = f"data-update/{file_name.replace('.csv','')}-{pd.Timestamp.utcnow().strftime('%Y%m%d-%H%M%S')}"
+                        base = cfg.base_branch
+                        # Encode the CSV on a worker thread while the branch
+                        # request is waiting on the network.
+                        with ThreadPoolExecutor(max_workers=1) as pool:
+                            csv_future = pool.submit(_to_csv_bytes, edited)
+                            create_branch(repo_full_name_str, base, branch_name, cfg.token)
+                            csv_bytes = csv_future.result()
+                        commit_file(
+                            repo_full_name_str,
+                            branch_name,
+                            f"duchenne_toolkit/data_final/{file_name}",
+                            csv_bytes,
+                            f"chore(data): update {file_name} via Streamlit",
+                            cfg.token,
+                            # The new branch starts from base, so the file there
+                            # should still match the copy on disk; this skips the
+                            # SHA lookup unless it has drifted.
+                            sha=git_blob_sha(path.read_bytes()),
+                        )
+                        original = df
+                        # One 64-bit hash per row; rows whose hash is absent from the
+                        # other frame were added/modified (new) or removed (old).
+                        h_new = pd.util.hash_pandas_object(edited, index=False).to_numpy()
+                        diff_df = pd.concat(
+                            [
+                                edited[~np.isin(h_new, h_old)].assign(_merge="added_or_modified"),
+                                original[~np.isin(h_old, h_new)].assign(_merge="removed"),
+                            ]
+                        )
+                        st.expander("Preview: changed rows").dataframe(diff_df, use_container_width=True)
+                        changelog = {
+                            "file": file_name,
+                            "rows_before": int(len(original)),
+                            "rows_after": int(len(edited)),
+                            "rows_modified": int(len(diff_df)),
+                        }
+                        body = "Automated data update from Streamlit app.\\n\\n" + json.dumps(changelog, indent=2)
+                        pr_url = open_pr(
+                            repo_full_name_str,
+                            branch_name,
+                            base,
+                            f"feat(data): update {file_name} via app",
+                            body,
+                            cfg.token,
+                        )
+                        st.success(f"Pull request created: {pr_url}")
+                    except Exception as exc:
+                        st.error(f"Failed to create pull request: {exc}")
+
+
+with edit_tab:
+    _edit_data()
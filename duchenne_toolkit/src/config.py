@@ -62,6 +62,8 @@ SOURCES_JSON = DOCS / "sources.json"
 
 # Geocoding settings
 GEOCODER_USER_AGENT = "duchenne_toolkit_geocoder"
+# Successful Nominatim results keyed by query; delete to force a fresh lookup
+GEOCODE_CACHE = DATA_INTERMEDIATE / "geocode_cache.json"
 
 # OpenRouteService API key (optional) – set this environment variable if available.
 import os
@@ -13,7 +13,7 @@ from __future__ import annotations
 import os
 import zipfile
 from io import BytesIO
-import requests
+import numpy as np
 import pandas as pd
 import requests
 
@@ -26,7 +26,7 @@ from .config import (
     BAND_DRIVE,
     COUNTY_CENTERS_URL,
 )
-from .utils_io import read_csv, write_csv, haversine_distance, classify_band
+from .utils_io import read_csv, write_csv, haversine_miles, classify_bands
 
 # Hard-coded geographic center coordinates for each US state and DC.
 # These approximate central points are used as a fallback when county
@@ -86,6 +86,10 @@ STATE_CENTROIDS = {
     "56": (42.756771, -107.302490),  # Wyoming
 }
 
+# STATE_CENTROIDS split into per-coordinate lookups for Series.map
+STATE_CENTROID_LAT = {fips: lat for fips, (lat, _) in STATE_CENTROIDS.items()}
+STATE_CENTROID_LON = {fips: lon for fips, (_, lon) in STATE_CENTROIDS.items()}
+
 
 def build_state_centroid_df(df_model: pd.DataFrame) -> pd.DataFrame:
     """Build a fallback centroid DataFrame using state geographic centers.
@@ -102,23 +106,15 @@ def build_state_centroid_df(df_model: pd.DataFrame) -> pd.DataFrame:
         DataFrame with columns state_fips, county_fips, centroid_lat,
         centroid_lon.
     """
-    records = []
-    for _, row in df_model.iterrows():
-        state_fips = str(row["state_fips"]).zfill(2)
-        county_fips = str(row["county_fips"]).zfill(3)
-        coords = STATE_CENTROIDS.get(state_fips)
-        if coords:
-            lat, lon = coords
-        else:
-            # Default to continental US center if unknown
-            lat, lon = 39.8283, -98.5795
-        records.append({
-            "state_fips": state_fips,
-            "county_fips": county_fips,
-            "centroid_lat": lat,
-            "centroid_lon": lon,
-        })
-    return pd.DataFrame(records)
+    state_fips = df_model["state_fips"].astype(str).str.zfill(2)
+    county_fips = df_model["county_fips"].astype(str).str.zfill(3)
+    # Default to continental US center if unknown
+    return pd.DataFrame({
+        "state_fips": state_fips,
+        "county_fips": county_fips,
+        "centroid_lat": state_fips.map(STATE_CENTROID_LAT).fillna(39.8283),
+        "centroid_lon": state_fips.map(STATE_CENTROID_LON).fillna(-98.5795),
+    })
 
 
 def load_county_centroids() -> pd.DataFrame:
@@ -130,12 +126,17 @@ def load_county_centroids() -> pd.DataFrame:
     geographic center (clat10, clon10).
     """
     print("Downloading county centers dataset...")
-    resp = requests.get(COUNTY_CENTERS_URL)
-    resp.raise_for_status()
-    from io import StringIO
-    df_centers = pd.read_csv(StringIO(resp.text))
+    # Parse straight from the response stream, and only the columns used below
+    with requests.get(COUNTY_CENTERS_URL, stream=True) as resp:
+        resp.raise_for_status()
+        resp.raw.decode_content = True
+        df_centers = pd.read_csv(
+            resp.raw,
+            usecols=["fips", "clat10", "clon10", "pclat10", "pclon10"],
+            dtype={"fips": str},
+        )
     # FIPS codes may have leading spaces; strip and pad
-    df_centers["fips"] = df_centers["fips"].astype(str).str.strip().str.zfill(5)
+    df_centers["fips"] = df_centers["fips"].str.strip().str.zfill(5)
     # Use population-weighted coordinates if available, else spatial
     df_centers["centroid_lat"] = df_centers["pclat10"].fillna(df_centers["clat10"])
     df_centers["centroid_lon"] = df_centers["pclon10"].fillna(df_centers["clon10"])
@@ -144,26 +145,54 @@ def load_county_centroids() -> pd.DataFrame:
     return df_centers[["state_fips", "county_fips", "centroid_lat", "centroid_lon"]]
 
 
-def compute_nearest_center(county_lat: float, county_lon: float, centers_df: pd.DataFrame) -> tuple:
-    """Return the nearest center's id, name and distance in miles."""
-    min_dist = float("inf")
-    nearest_id = None
-    nearest_name = None
-    for _, row in centers_df.iterrows():
-        if pd.isna(row["lat"]) or pd.isna(row["lon"]):
-            continue
-        dist = haversine_distance(county_lat, county_lon, row["lat"], row["lon"])
-        if dist < min_dist:
-            min_dist = dist
-            nearest_id = row["center_id"]
-            nearest_name = row["center_name"]
-    return nearest_id, nearest_name, min_dist
+# Cap on distance-matrix cells held at once (about 8 MB of float64), so the
+# county x center search stays in constant memory as the center list grows.
+NEAREST_BLOCK_CELLS = 1_000_000
+
+
+def compute_nearest_center(
+    county_lat: np.ndarray,
+    county_lon: np.ndarray,
+    c_lat: np.ndarray,
+    c_lon: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return the nearest center's index and distance in miles for each county.
+
+    Distances come from a counties x centers haversine matrix, reduced with
+    argmin per row; counties are processed in blocks of at most
+    NEAREST_BLOCK_CELLS cells.  Counties with a missing coordinate get index
+    -1 and a NaN distance; when there are no centers every distance is
+    infinite.
+    """
+    n = len(county_lat)
+    missing = np.isnan(county_lat) | np.isnan(county_lon)
+    if len(c_lat) == 0:
+        return np.full(n, -1), np.where(missing, np.nan, np.inf)
+    idx = np.empty(n, dtype=np.intp)
+    dist = np.empty(n, dtype="float64")
+    step = max(1, NEAREST_BLOCK_CELLS // len(c_lat))
+    for start in range(0, n, step):
+        rows = slice(start, start + step)
+        block = haversine_miles(
+            county_lat[rows, None], county_lon[rows, None], c_lat[None, :], c_lon[None, :]
+        )
+        block[missing[rows]] = np.inf
+        nearest = block.argmin(axis=1)
+        idx[rows] = nearest
+        dist[rows] = block[np.arange(len(nearest)), nearest]
+    idx[missing] = -1
+    dist[missing] = np.nan
+    return idx, dist
 
 
 def main():
     # Load data
     df_centers = read_csv(CENTERS_OUTPUT)
-    df_model = read_csv(DMD_MODEL_OUTPUT)
+    # Only the keys, name and mid estimate end up in the coverage table
+    df_model = read_csv(
+        DMD_MODEL_OUTPUT,
+        usecols=["state_fips", "county_fips", "county_name", "modeled_dmd_5_24_mid"],
+    )
     # If center coordinates are missing, assign state centroid coordinates
     # Build mapping of state abbreviations to FIPS codes
     STATE_ABBR_TO_FIPS = {
@@ -179,25 +208,16 @@ def main():
         "VT": "50", "VA": "51", "WA": "53", "WV": "54", "WI": "55",
         "WY": "56",
     }
-    # Assign FIPS and centroid coordinates for each center if lat/lon missing
-    def assign_center_coords(row):
-        if pd.notnull(row.get("lat")) and pd.notnull(row.get("lon")):
-            return row["lat"], row["lon"]
-        state_abbr = row.get("state")
-        fips = STATE_ABBR_TO_FIPS.get(state_abbr)
-        coords = STATE_CENTROIDS.get(fips)
-        if coords:
-            return coords
-        # Default to continental US center
-        return (39.8283, -98.5795)
-    lats = []
-    lons = []
-    for _, r in df_centers.iterrows():
-        lat, lon = assign_center_coords(r)
-        lats.append(lat)
-        lons.append(lon)
-    df_centers["lat"] = lats
-    df_centers["lon"] = lons
+    # Centers missing either coordinate get their state's centroid, or the
+    # continental US center if the state is unknown
+    state_fips = df_centers["state"].map(STATE_ABBR_TO_FIPS)
+    has_coords = df_centers["lat"].notna() & df_centers["lon"].notna()
+    df_centers["lat"] = df_centers["lat"].where(
+        has_coords, state_fips.map(STATE_CENTROID_LAT).fillna(39.8283)
+    )
+    df_centers["lon"] = df_centers["lon"].where(
+        has_coords, state_fips.map(STATE_CENTROID_LON).fillna(-98.5795)
+    )
     # Load county centroids
     try:
         gdf_centroids = load_county_centroids()
@@ -210,45 +230,43 @@ def main():
     df_model["county_fips"] = df_model["county_fips"].astype(str).str.zfill(3)
     gdf_centroids["state_fips"] = gdf_centroids["state_fips"].astype(str).str.zfill(2)
     gdf_centroids["county_fips"] = gdf_centroids["county_fips"].astype(str).str.zfill(3)
-    # Merge model with centroids on FIPS codes only
-    df = df_model.merge(gdf_centroids, on=["state_fips", "county_fips"], how="left")
-    # Compute nearest center for each county
-    nearest_ids: list[str | None] = []
-    nearest_names: list[str | None] = []
-    distances: list[float | None] = []
-    drive_times: list[float | None] = []
-    for _, row in df.iterrows():
-        county_lat = row["centroid_lat"]
-        county_lon = row["centroid_lon"]
-        # If centroid is missing, skip distance calculation
-        if pd.isna(county_lat) or pd.isna(county_lon):
-            nearest_ids.append(None)
-            nearest_names.append(None)
-            distances.append(None)
-            drive_times.append(None)
-            continue
-        center_id, center_name, dist = compute_nearest_center(county_lat, county_lon, df_centers)
-        nearest_ids.append(center_id)
-        nearest_names.append(center_name)
-        distances.append(dist)
-        # Approximate drive time: assume 50 mph average speed
-        if dist is not None:
-            drive_times.append(dist / 50 * 60)  # miles / mph * 60 = minutes
-        else:
-            drive_times.append(None)
+    # Look centroids up on one combined FIPS key rather than merging on two
+    # string columns: a single hash table over the centroid index
+    centroids = gdf_centroids.set_index(gdf_centroids["state_fips"] + gdf_centroids["county_fips"])
+    centroids = centroids.loc[~centroids.index.duplicated(), ["centroid_lat", "centroid_lon"]]
+    fips = df_model["state_fips"] + df_model["county_fips"]
+    df = df_model
+    df["centroid_lat"] = fips.map(centroids["centroid_lat"])
+    df["centroid_lon"] = fips.map(centroids["centroid_lon"])
+    # Center coordinates as arrays (centers without coordinates can't be nearest)
+    located = df_centers.dropna(subset=["lat", "lon"])
+    c_lat = located["lat"].to_numpy(dtype="float64")
+    c_lon = located["lon"].to_numpy(dtype="float64")
+    # Nearest center for every county in one pass
+    idx, dist = compute_nearest_center(
+        df["centroid_lat"].to_numpy(dtype="float64"),
+        df["centroid_lon"].to_numpy(dtype="float64"),
+        c_lat,
+        c_lon,
+    )
+    found = idx >= 0
+    nearest_ids = np.full(len(df), None, dtype=object)
+    nearest_names = np.full(len(df), None, dtype=object)
+    nearest_ids[found] = located["center_id"].to_numpy()[idx[found]]
+    nearest_names[found] = located["center_name"].to_numpy()[idx[found]]
     df["nearest_center_id"] = nearest_ids
     df["nearest_center_name"] = nearest_names
-    df["great_circle_mi"] = distances
-    df["drive_time_minutes"] = drive_times
+    df["great_circle_mi"] = dist
+    # Approximate drive time: assume 50 mph average speed
+    df["drive_time_minutes"] = dist / 50 * 60  # miles / mph * 60 = minutes
     # Classify bands
-    df["band_miles"] = df["great_circle_mi"].apply(lambda x: classify_band(x, BAND_MILES) if pd.notnull(x) else "Unknown")
-    df["band_drive_time"] = df["drive_time_minutes"].apply(lambda x: classify_band(x, BAND_DRIVE) if pd.notnull(x) else "Unknown")
+    df["band_miles"] = classify_bands(df["great_circle_mi"], BAND_MILES)
+    df["band_drive_time"] = classify_bands(df["drive_time_minutes"], BAND_DRIVE)
     # Flags for gaps: counties beyond 300 miles or 360 minutes
-    df["flags"] = df.apply(
-        lambda r: "distance_gt_300" if r["band_miles"] == ">300" else (
-            "drive_gt_360" if r["band_drive_time"] == ">360" else ""
-        ),
-        axis=1,
+    df["flags"] = np.select(
+        [df["band_miles"].eq(">300"), df["band_drive_time"].eq(">360")],
+        ["distance_gt_300", "drive_gt_360"],
+        default="",
     )
     # Keep necessary columns
     df_cov = df[[
@@ -262,7 +280,8 @@ def main():
     write_csv(COVERAGE_OUTPUT, df_cov)
     print(f"Wrote coverage file to {COVERAGE_OUTPUT}")
     # Gap counties
-    df_gap = df_cov[(df_cov["band_miles"] == ">300") | (df_cov["band_drive_time"] == ">360")].copy()
+    # sort_values returns a new frame, so the filtered slice needs no copy first
+    df_gap = df_cov[(df_cov["band_miles"] == ">300") | (df_cov["band_drive_time"] == ">360")]
     df_gap = df_gap.sort_values(by="modeled_dmd_5_24_mid", ascending=False)
     write_csv(GAP_OUTPUT, df_gap)
     print(f"Wrote gap file to {GAP_OUTPUT} with {len(df_gap)} counties")
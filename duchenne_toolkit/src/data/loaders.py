@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+import json
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 
 # Paths relative to the package root: duchenne_toolkit/
 BASE_DIR: Path = Path(__file__).resolve().parents[2]
@@ -11,10 +17,91 @@ DATA_FINAL_DIR: Path = BASE_DIR / "data_final"
 LOOKUP_DIR: Path = BASE_DIR / "data" / "lookups"
 DERIVED_DIR: Path = BASE_DIR / "data" / "derived"
 
+# Part of every Parquet cache file name.  Bump it when a reader or its dtypes
+# change, so caches written by older code are never taken as fresh.
+CACHE_VERSION = 2
+
+# Parquet schema metadata key holding load_coverage's debug report.
+_DEBUG_KEY = b"duchenne_toolkit.debug"
+
+# Column types for the pyarrow CSV reader.  FIPS pieces and names are kept as
+# Arrow strings (not object columns, whatever the pandas version); numeric
+# columns are typed up front so no to_numeric pass is needed.
+COVERAGE_DTYPES: Dict[str, str] = {
+    "state_fips": "string[pyarrow]",
+    "county_fips": "string[pyarrow]",
+    "county_name": "string[pyarrow]",
+    "nearest_center_name": "string[pyarrow]",
+    "band_miles": "string[pyarrow]",
+    "lat": "float64",
+    "lon": "float64",
+    "modeled_dmd_5_24_mid": "float64",
+    "great_circle_mi": "float64",
+}
+
+CENTERS_DTYPES: Dict[str, str] = {
+    "center_id": "string[pyarrow]",
+    "center_name": "string[pyarrow]",
+    "state": "string[pyarrow]",
+    "lat": "float32",
+    "lon": "float32",
+}
+
+
+def _arrow_types(dtypes: Dict[str, str]) -> Dict[str, pa.DataType]:
+    return {
+        c: pa.string() if d.startswith("string") else pa.from_numpy_dtype(np.dtype(d))
+        for c, d in dtypes.items()
+    }
+
+
+def read_typed_csv(
+    path: Path, dtypes: Dict[str, str], usecols: Optional[List[str]] = None
+) -> pd.DataFrame:
+    """
+    Read a CSV with pyarrow, giving the columns in dtypes those types.
+
+    pd.read_csv(engine="pyarrow") infers types first and casts afterwards,
+    so a FIPS code typed as a string comes back as "1" rather than "01".
+    Here the types go to the pyarrow parser itself; other columns are
+    inferred.  Empty fields are missing values, as with pd.read_csv.  With
+    usecols, only those columns are parsed.
+
+    A numeric column holding text that does not parse (say "~0.5" or "n/a")
+    does not fail the read: the file is re-read with the numeric columns as
+    text and those cells become NaN, as with pd.to_numeric(errors="coerce").
+    """
+
+    def read(types: Dict[str, pa.DataType]) -> pd.DataFrame:
+        table = pacsv.read_csv(
+            path,
+            convert_options=pacsv.ConvertOptions(
+                column_types=types,
+                include_columns=usecols or [],
+                strings_can_be_null=True,
+            ),
+        )
+        return table.to_pandas()
+
+    column_types = _arrow_types(dtypes)
+    try:
+        df = read(column_types)
+    except pa.ArrowInvalid:
+        numeric = [c for c, d in dtypes.items() if not d.startswith("string")]
+        df = read({**column_types, **{c: pa.string() for c in numeric}})
+        for c in numeric:
+            if c in df.columns:
+                df[c] = pd.to_numeric(df[c], errors="coerce").to_numpy(
+                    dtype="float64", na_value=np.nan
+                )
+    return df.astype({c: d for c, d in dtypes.items() if c in df.columns})
+
 
 def _ensure_lat_lon(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, int | None]]:
     report: Dict[str, int | None] = {}
-    df = df.copy()
+    # Shallow: columns below are replaced, never written in place, so the
+    # caller's frame is untouched without duplicating its data.
+    df = df.copy(deep=False)
 
     rmap = {}
     for cand in ["latitude", "lat_dd", "INTPTLAT", "y", "Lat", "LAT"]:
@@ -29,7 +116,7 @@ def _ensure_lat_lon(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, int | Non
         df = df.rename(columns=rmap)
 
     for c in ["lat", "lon"]:
-        if c in df.columns:
+        if c in df.columns and not pd.api.types.is_numeric_dtype(df[c]):
             df[c] = pd.to_numeric(df[c], errors="coerce")
 
     if {"lat", "lon"}.issubset(df.columns):
@@ -42,20 +129,86 @@ def _ensure_lat_lon(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, int | Non
     return df, report
 
 
+def _is_fresh(cache: Path, *sources: Path) -> bool:
+    """True if cache exists and is at least as new as every existing source."""
+    if not cache.exists():
+        return False
+    mtime = cache.stat().st_mtime
+    return all(mtime >= src.stat().st_mtime for src in sources if src.exists())
+
+
+def _cache_path(stem: str) -> Path:
+    return DERIVED_DIR / f"{stem}.v{CACHE_VERSION}.parquet"
+
+
+def _load_centroids(lookup_file: Path) -> pd.DataFrame:
+    """
+    County centroid lookup: centroid_lat and centroid_lon indexed by a unique
+    geoid (the first row wins if the file repeats one), ready for Series.map.
+
+    The parsed lookup is cached as Parquet in the derived directory and read
+    instead of the CSV while it is newer.  Within a process the frame is also
+    kept in memory until the CSV changes; callers must not modify it.
+    """
+    return _read_centroids(lookup_file, lookup_file.stat().st_mtime)
+
+
+@lru_cache(maxsize=1)
+def _read_centroids(lookup_file: Path, mtime: float) -> pd.DataFrame:
+    # mtime is only part of the cache key, so a rewritten lookup is re-read.
+    cache_path = _cache_path("county_centroids")
+    if _is_fresh(cache_path, lookup_file):
+        lookup = pd.read_parquet(cache_path, engine="pyarrow")
+    else:
+        # Only the key and point columns (a full gazetteer file has many more),
+        # parsed straight to text and float64.  A malformed point ("n/a")
+        # becomes NaN through read_typed_csv's coercing fallback rather than
+        # failing load_coverage.
+        lookup = read_typed_csv(
+            lookup_file,
+            {"GEOID": "string[pyarrow]", "INTPTLAT": "float64", "INTPTLONG": "float64"},
+            usecols=["GEOID", "INTPTLAT", "INTPTLONG"],
+        )
+        lookup = lookup.rename(
+            columns={"GEOID": "geoid", "INTPTLAT": "centroid_lat", "INTPTLONG": "centroid_lon"}
+        )
+
+        DERIVED_DIR.mkdir(parents=True, exist_ok=True)
+        lookup.to_parquet(cache_path, engine="pyarrow", compression="zstd", index=False)
+    return lookup.drop_duplicates("geoid").set_index("geoid")
+
+
 def load_coverage() -> Tuple[pd.DataFrame, Dict[str, int | str | None]]:
     """
     Load duchenne_toolkit/data_final/county_coverage.csv and enrich with county centroids.
     Persists a derived CSV with coords to duchenne_toolkit/data/derived/coverage_with_coords.csv
     and returns (df, debug_report).
+
+    The enriched frame is also cached as Parquet next to the derived CSV; while
+    that file is newer than the coverage CSV and the centroid lookup it is read
+    instead of re-parsing and re-merging.
     """
     debug: Dict[str, int | str | None] = {}
     path = DATA_FINAL_DIR / "county_coverage.csv"
-    df = pd.read_csv(path, dtype=str)
+    lookup_file = LOOKUP_DIR / "county_centroids.csv"
+    derived_path = DERIVED_DIR / "coverage_with_coords.csv"
+    cache_path = _cache_path("coverage_with_coords")
+
+    if _is_fresh(cache_path, path, lookup_file):
+        df = pd.read_parquet(cache_path, engine="pyarrow")
+        metadata = pq.read_schema(cache_path).metadata or {}
+        debug.update(json.loads(metadata.get(_DEBUG_KEY, b"{}")))
+        # Not stored: the checkout may have moved since the cache was written.
+        debug["derived_path"] = str(derived_path)
+        return df, debug
 
+    df = read_typed_csv(path, COVERAGE_DTYPES)
+
+    # Already Arrow strings per COVERAGE_DTYPES; pad without leaving that dtype.
     if "state_fips" in df.columns:
-        df["state_fips"] = df["state_fips"].astype(str).str.zfill(2)
+        df["state_fips"] = df["state_fips"].str.zfill(2)
     if "county_fips" in df.columns:
-        df["county_fips"] = df["county_fips"].astype(str).str.zfill(3)
+        df["county_fips"] = df["county_fips"].str.zfill(3)
     if {"state_fips", "county_fips"}.issubset(df.columns):
         df["geoid"] = df["state_fips"] + df["county_fips"]
     else:
@@ -64,31 +217,20 @@ def load_coverage() -> Tuple[pd.DataFrame, Dict[str, int | str | None]]:
     df, rep0 = _ensure_lat_lon(df)
     debug.update(rep0)
 
-    need_coords = (
-        ({"lat", "lon"}.issubset(df.columns) and (df["lat"].isna() | df["lon"].isna()).any())
-        or not {"lat", "lon"}.issubset(df.columns)
-    )
+    # When both columns exist, _ensure_lat_lon has already dropped every row
+    # missing one, so centroids are only needed if the file lacks a column.
+    need_coords = not {"lat", "lon"}.issubset(df.columns)
 
     if need_coords:
-        lookup_file = LOOKUP_DIR / "county_centroids.csv"
         if lookup_file.exists():
-            lookup = pd.read_csv(lookup_file, dtype={"GEOID": str})
-            lookup = lookup.rename(
-                columns={"GEOID": "geoid", "INTPTLAT": "centroid_lat", "INTPTLONG": "centroid_lon"}
-            )
-            lookup["centroid_lat"] = pd.to_numeric(lookup["centroid_lat"], errors="coerce")
-            lookup["centroid_lon"] = pd.to_numeric(lookup["centroid_lon"], errors="coerce")
-
-            df = df.merge(lookup[["geoid", "centroid_lat", "centroid_lon"]], on="geoid", how="left")
-            if "lat" not in df.columns:
-                df["lat"] = df["centroid_lat"]
-            else:
-                df["lat"] = df["lat"].fillna(df["centroid_lat"])
-            if "lon" not in df.columns:
-                df["lon"] = df["centroid_lon"]
-            else:
-                df["lon"] = df["lon"].fillna(df["centroid_lon"])
-            df = df.drop(columns=[c for c in ["centroid_lat", "centroid_lon"] if c in df.columns])
+            centroids = _load_centroids(lookup_file)
+            # A hashed map against the unique-geoid index; a coordinate the
+            # file does have is kept.
+            for col in ("lat", "lon"):
+                filled = df["geoid"].map(centroids[f"centroid_{col}"])
+                if col in df.columns:
+                    filled = df[col].fillna(filled)
+                df[col] = filled
         # else: leave missing; app will warn
 
     if {"lat", "lon"}.issubset(df.columns):
@@ -97,8 +239,31 @@ def load_coverage() -> Tuple[pd.DataFrame, Dict[str, int | str | None]]:
         debug["missing_after_merge"] = None
 
     DERIVED_DIR.mkdir(parents=True, exist_ok=True)
-    derived_path = DERIVED_DIR / "coverage_with_coords.csv"
     df.to_csv(derived_path, index=False)
+    # The debug report travels in the Parquet schema metadata (written with
+    # pyarrow directly: pandas only round-trips attrs from 2.1).
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    metadata = {**(table.schema.metadata or {}), _DEBUG_KEY: json.dumps(debug).encode()}
+    pq.write_table(table.replace_schema_metadata(metadata), cache_path, compression="zstd")
     debug["derived_path"] = str(derived_path)
 
     return df, debug
+
+
+def load_centers(path: Path | None = None) -> pd.DataFrame:
+    """
+    Load the care-center CSV (duchenne_toolkit/data_final/centers_cdcc_us.csv
+    by default) with CENTERS_DTYPES.
+
+    A typed Parquet copy is kept in the derived directory and read instead
+    while it is newer than the CSV.
+    """
+    path = path or DATA_FINAL_DIR / "centers_cdcc_us.csv"
+    cache_path = _cache_path(path.stem)
+    if _is_fresh(cache_path, path):
+        return pd.read_parquet(cache_path, engine="pyarrow")
+
+    df = read_typed_csv(path, CENTERS_DTYPES)
+    DERIVED_DIR.mkdir(parents=True, exist_ok=True)
+    df.to_parquet(cache_path, engine="pyarrow", compression="zstd", index=False)
+    return df
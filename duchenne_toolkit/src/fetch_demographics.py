@@ -25,6 +25,7 @@ strictly ACS data) for compatibility with downstream scripts.
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 from pathlib import Path
 
@@ -39,13 +40,22 @@ def main() -> None:
     cols = [
         "state",
         "county",
-        "stname",
         "ctyname",
         "agegrp",
         "yearref",
         "tot_male",
     ]
-    df = pd.read_csv(source_path, usecols=cols)
+    # Nullable integer types, so a blank cell reads as NA instead of failing
+    # the read.  county holds the full 5-digit code (up to 56045), hence Int32
+    # for the FIPS codes, which stay numeric for the formatting below.
+    dtypes = {
+        "state": "Int32",
+        "county": "Int32",
+        "agegrp": "Int8",
+        "yearref": "Int16",
+        "tot_male": "Int32",
+    }
+    df = pd.read_csv(source_path, usecols=cols, dtype=dtypes)
     # Filter for age groups of interest (5–9, 10–14, 15–19, 20–24)
     age_map = {
         3: "male_5_9",
@@ -53,24 +63,25 @@ def main() -> None:
         5: "male_15_19",
         6: "male_20_24",
     }
-    df = df[df["agegrp"].isin(age_map.keys())].copy()
-    # Compute mean male count across all yearref values for each county and agegrp
-    grouped = (
-        df.groupby(["state", "county", "stname", "ctyname", "agegrp"])["tot_male"]
-        .mean()
-        .reset_index()
-    )
-    # Pivot age groups to columns
-    pivot = grouped.pivot_table(
-        index=["state", "county", "stname", "ctyname"],
-        columns="agegrp",
-        values="tot_male",
-    ).reset_index()
-    # Rename columns based on mapping
-    pivot = pivot.rename(columns=age_map)
-    # Ensure FIPS codes are zero‑padded strings
-    pivot["state_fips"] = pivot["state"].astype(str).str.zfill(2)
-    pivot["county_fips"] = pivot["county"].astype(str).str.zfill(3)
+    # The codes are contiguous, so a range compare replaces the isin lookup;
+    # everything below builds new frames, so no copy is needed
+    df = df[df["agegrp"].between(min(age_map), max(age_map))]
+    # Compute mean male count across all yearref values for each county and
+    # agegrp.  (state, county) already determines the names, so group on the
+    # codes alone and attach the county name afterwards.
+    grouped = df.groupby(["state", "county", "agegrp"], observed=True)["tot_male"].mean()
+    # Pivot age groups to columns and rename them based on mapping
+    pivot = grouped.unstack("agegrp").rename(columns=age_map).reset_index()
+    names = df[["state", "county", "ctyname"]].drop_duplicates(["state", "county"])
+    pivot = pivot.merge(names, on=["state", "county"], how="left")
+    # Ensure FIPS codes are zero‑padded strings; the codes are read as
+    # integers, so format them in one NumPy pass rather than str + zfill.
+    # "%d" would happily turn a corrupted code into "-9491", so check first.
+    for col, top in (("state", 99), ("county", 99999)):
+        if not pivot[col].between(0, top).all():
+            raise ValueError(f"{source_path}: {col} codes outside 0..{top}")
+    pivot["state_fips"] = np.char.mod("%02d", pivot["state"].to_numpy(dtype=np.int64))
+    pivot["county_fips"] = np.char.mod("%03d", pivot["county"].to_numpy(dtype=np.int64))
     pivot["county_name"] = pivot["ctyname"].astype(str)
     # Select and order output columns
     out_cols = [
@@ -12,6 +12,7 @@ from __future__ import annotations
 
 import time
 import pandas as pd
+import requests
 from typing import List, Dict
 
 from .config import (
@@ -19,8 +20,9 @@ from .config import (
     DATA_FINAL,
     CENTERS_OUTPUT,
     SOURCES_JSON,
+    GEOCODE_CACHE,
 )
-from .utils_io import geocode_address, write_csv, save_json
+from .utils_io import geocode_address, write_csv, save_json, load_json
 
 
 def get_center_definitions() -> List[Dict[str, str]]:
@@ -80,9 +82,24 @@ def main() -> None:
     centers = get_center_definitions()
     records = []
     sources = []
+    # Nominatim allows one request per second, so lookups stay sequential; a
+    # shared session keeps the connection open between them.
+    session = requests.Session()
+    last_request = 0.0
+    # Results from earlier runs; only queries not found before hit the network
+    cache = load_json(GEOCODE_CACHE) if GEOCODE_CACHE.exists() else {}
     for idx, center in enumerate(centers, start=1):
         query = f"{center['center_name']}, {center['city']}, {center['state']}, USA"
-        result = geocode_address(query)
+        result = cache.get(query)
+        if result is None:
+            # Courtesy delay: only wait out what is left of the one-second interval
+            wait = 1 - (time.monotonic() - last_request)
+            if wait > 0:
+                time.sleep(wait)
+            last_request = time.monotonic()
+            result = geocode_address(query, session=session)
+            if result:
+                cache[query] = result
         lat = lon = None
         street = city = state = postal_code = None
         if result:
@@ -117,8 +134,8 @@ def main() -> None:
             "data_source": "PPMD publications",
             "retrieved_date": RUN_DATE,
         })
-        # Respect courtesy delay between geocoding requests
-        time.sleep(1)
+    session.close()
+    save_json(GEOCODE_CACHE, cache)
     df = pd.DataFrame(records)
     write_csv(CENTERS_OUTPUT, df)
     # Save a simple list of sources
@@ -31,7 +31,11 @@ def make_interactive_map():
         geojson_resp.raise_for_status()
         counties_geojson = geojson_resp.json()
         # Load model and centers
-        df_model = pd.read_csv(DMD_MODEL_OUTPUT, dtype={"state_fips": str, "county_fips": str})
+        df_model = pd.read_csv(
+            DMD_MODEL_OUTPUT,
+            usecols=["state_fips", "county_fips", "modeled_dmd_5_24_mid"],
+            dtype={"state_fips": str, "county_fips": str},
+        )
         df_centers = pd.read_csv(CENTERS_OUTPUT)
         df_model["fips"] = df_model["state_fips"] + df_model["county_fips"]
         m = folium.Map(location=[39.8283, -98.5795], zoom_start=4, tiles="cartodbpositron")
@@ -56,16 +60,16 @@ def make_interactive_map():
                 aliases=["County"],
             ),
         ).add_to(m)
-        for _, row in df_centers.iterrows():
-            if pd.notnull(row.get("lat")) and pd.notnull(row.get("lon")):
-                folium.CircleMarker(
-                    location=[row["lat"], row["lon"]],
-                    radius=4,
-                    color="blue",
-                    fill=True,
-                    fill_opacity=0.8,
-                    popup=f"{row['center_name']} ({row['state']})",
-                ).add_to(m)
+        located = df_centers.dropna(subset=["lat", "lon"])
+        for row in located[["lat", "lon", "center_name", "state"]].itertuples(index=False):
+            folium.CircleMarker(
+                location=[row.lat, row.lon],
+                radius=4,
+                color="blue",
+                fill=True,
+                fill_opacity=0.8,
+                popup=f"{row.center_name} ({row.state})",
+            ).add_to(m)
         m.save(MAPS / "duchenne_coverage_interactive.html")
         print(f"Saved interactive map to {MAPS / 'duchenne_coverage_interactive.html'}")
     except Exception as exc:
@@ -116,27 +120,20 @@ def make_static_map():
     }
 
     # Assign lat/lon to counties and centers
-    lats = []
-    lons = []
-    for _, r in df_cov.iterrows():
-        coords = STATE_CENTROIDS.get(r["state_fips"], (39.8283, -98.5795))
-        lats.append(coords[0])
-        lons.append(coords[1])
-    df_cov["lat"] = lats
-    df_cov["lon"] = lons
-    center_lats = []
-    center_lons = []
-    for _, r in df_centers.iterrows():
-        # use center lat/lon if present; otherwise state centroid
-        if pd.notnull(r.get("lat")) and pd.notnull(r.get("lon")):
-            center_lats.append(r["lat"])
-            center_lons.append(r["lon"])
-        else:
-            coords = STATE_CENTROIDS.get(STATE_ABBR_TO_FIPS.get(r["state"], ""), (39.8283, -98.5795))
-            center_lats.append(coords[0])
-            center_lons.append(coords[1])
-    df_centers["plot_lat"] = center_lats
-    df_centers["plot_lon"] = center_lons
+    default_lat, default_lon = 39.8283, -98.5795
+    centroid_lat = {fips: lat for fips, (lat, _) in STATE_CENTROIDS.items()}
+    centroid_lon = {fips: lon for fips, (_, lon) in STATE_CENTROIDS.items()}
+    df_cov["lat"] = df_cov["state_fips"].map(centroid_lat).fillna(default_lat)
+    df_cov["lon"] = df_cov["state_fips"].map(centroid_lon).fillna(default_lon)
+    # use center lat/lon if present; otherwise state centroid
+    center_fips = df_centers["state"].map(STATE_ABBR_TO_FIPS)
+    has_coords = df_centers["lat"].notna() & df_centers["lon"].notna()
+    df_centers["plot_lat"] = df_centers["lat"].where(
+        has_coords, center_fips.map(centroid_lat).fillna(default_lat)
+    )
+    df_centers["plot_lon"] = df_centers["lon"].where(
+        has_coords, center_fips.map(centroid_lon).fillna(default_lon)
+    )
     # Plot scatter map
     fig, ax = plt.subplots(figsize=(12, 8))
     band_colors = {
@@ -145,8 +142,10 @@ def make_static_map():
         ">300": "#de2d26",
         "Unknown": "#f0f0f0",
     }
+    # Row positions per band from one hashing pass rather than a comparison scan per band
+    band_rows = df_cov.groupby("band_miles", sort=False).indices
     for band, color in band_colors.items():
-        subset = df_cov[df_cov["band_miles"] == band]
+        subset = df_cov.iloc[band_rows.get(band, [])]
         ax.scatter(subset["lon"], subset["lat"], s=8, color=color, label=band, alpha=0.6)
     ax.scatter(df_centers["plot_lon"], df_centers["plot_lat"], s=50, color="blue", marker="^", label="Care centers")
     ax.set_xlabel("Longitude")
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import base64
+import hashlib
 from typing import Optional, Tuple
 
 import requests
@@ -61,6 +62,12 @@ def _get_file_sha(repo: str, path: str, branch: str, token: str) -> Optional[str
     return r.json().get("sha")
 
 
+def git_blob_sha(content_bytes: bytes) -> str:
+    """SHA git (and the Contents API) assigns to a file with these bytes."""
+    header = f"blob {len(content_bytes)}\0".encode("ascii")
+    return hashlib.sha1(header + content_bytes).hexdigest()
+
+
 def commit_file(
     repo: str,
     branch: str,
@@ -68,10 +75,18 @@ def commit_file(
     content_bytes: bytes,
     message: str,
     token: str,
+    sha: Optional[str] = None,
 ) -> None:
-    """Create or update a file on a branch using the Contents API."""
+    """Create or update a file on a branch using the Contents API.
+
+    If ``sha`` (the file's expected current blob SHA) is given, the PUT is
+    sent straight away and the SHA is only looked up if GitHub rejects it.
+    """
     owner, name = _split_repo(repo)
-    sha = _get_file_sha(repo, path, branch, token)
+    url = f"{GITHUB_API}/repos/{owner}/{name}/contents/{path}"
+    guessed = sha is not None
+    if not guessed:
+        sha = _get_file_sha(repo, path, branch, token)
 
     payload = {
         "message": message,
@@ -81,11 +96,14 @@ def commit_file(
     if sha:
         payload["sha"] = sha
 
-    r = requests.put(
-        f"{GITHUB_API}/repos/{owner}/{name}/contents/{path}",
-        headers=_headers(token),
-        json=payload,
-    )
+    r = requests.put(url, headers=_headers(token), json=payload)
+    # 409 = sha does not match the branch, 422 = sha required/invalid
+    if guessed and r.status_code in (409, 422):
+        sha = _get_file_sha(repo, path, branch, token)
+        payload.pop("sha", None)
+        if sha:
+            payload["sha"] = sha
+        r = requests.put(url, headers=_headers(token), json=payload)
     r.raise_for_status()
 
 
@@ -4,6 +4,9 @@ from typing import Any, Dict, Optional
 
 import pandas as pd
 
+# Same shapes validate_fips accepts, as one pattern for Series.str.fullmatch.
+_FIPS_PATTERN = r"\d{2}|\d{3}|\d{5}"
+
 
 def validate_fips(val: Any) -> bool:
     """
@@ -17,6 +20,32 @@ def validate_fips(val: Any) -> bool:
     return len(s) in (2, 3, 5)
 
 
+def validate_fips_series(values: pd.Series) -> pd.Series:
+    """
+    Vectorized validate_fips: boolean mask, True where the value looks valid.
+    """
+    s = values.astype("string").str.strip()
+    return s.str.fullmatch(_FIPS_PATTERN).fillna(False).astype(bool)
+
+
+# Accepted spellings for each distance band, after lowercasing, dropping
+# spaces and replacing "-" with "_".
+_BAND_ALIASES = {
+    "<=150": {"<=150", "<=150mi", "le150", "0_150", "0to150", "0_150mi", "under150"},
+    "150_300": {"150_300", "150to300", "150_300mi", "150-300"},
+    ">300": {">300", ">300mi", "over300", "gt300"},
+}
+_BAND_MAP = {alt: norm for norm, alts in _BAND_ALIASES.items() for alt in alts | {norm}}
+
+
+def _miles_to_band(v: float) -> str:
+    if v <= 150:
+        return "<=150"
+    if v <= 300:
+        return "150_300"
+    return ">300"
+
+
 def coerce_distance_band(x: Any) -> Optional[str]:
     """
     Normalizes to one of: '<=150', '150_300', '>300'. Returns None if unknown.
@@ -31,26 +60,41 @@ def coerce_distance_band(x: Any) -> Optional[str]:
         .replace("-", "_")
     )
 
-    mapping = {
-        "<=150": {"<=150", "<=150mi", "le150", "0_150", "0to150", "0_150mi", "under150"},
-        "150_300": {"150_300", "150to300", "150_300mi", "150-300"},
-        ">300": {">300", ">300mi", "over300", "gt300"},
-    }
-    for norm, alts in mapping.items():
-        if s == norm or s in alts:
-            return norm
+    if s in _BAND_MAP:
+        return _BAND_MAP[s]
 
     try:
-        v = float(s.replace("mi", ""))
-        if v <= 150:
-            return "<=150"
-        if v <= 300:
-            return "150_300"
-        return ">300"
+        return _miles_to_band(float(s.replace("mi", "")))
     except Exception:
         return None
 
 
+def coerce_distance_band_series(values: pd.Series) -> pd.Series:
+    """
+    Vectorized coerce_distance_band, giving the same result for every value.
+    """
+    s = (
+        values.astype("string")
+        .str.strip()
+        .str.lower()
+        .str.replace(" ", "", regex=False)
+        .str.replace("-", "_", regex=False)
+    )
+    norm = s.map(_BAND_MAP)
+    # Known aliases are resolved above in one pass.  The rest (mileages, and
+    # missing or malformed cells, which the scalar rules treat differently
+    # depending on the raw value) go through coerce_distance_band itself.
+    rest = norm.isna()
+    if not rest.any():
+        return norm
+    fallback = pd.Series(
+        [coerce_distance_band(v) for v in values[rest].to_numpy(dtype=object)],
+        index=values.index[rest],
+        dtype="string",
+    )
+    return norm.fillna(fallback)
+
+
 def show_validation_report(report: Dict[str, Any], st=None) -> None:
     """
     Print a compact summary in Streamlit if provided, else stdout.
@@ -21,9 +21,9 @@ def write_csv(path: Path, df: pd.DataFrame) -> None:
     df.to_csv(path, index=False)
 
 
-def read_csv(path: Path) -> pd.DataFrame:
-    """Read a CSV file into a pandas DataFrame."""
-    return pd.read_csv(path)
+def read_csv(path: Path, usecols: Optional[List[str]] = None) -> pd.DataFrame:
+    """Read a CSV file into a pandas DataFrame, optionally only ``usecols``."""
+    return pd.read_csv(path, usecols=usecols)
 
 
 def save_json(path: Path, data: dict) -> None:
@@ -38,12 +38,17 @@ def load_json(path: Path) -> dict:
         return json.load(f)
 
 
-def geocode_address(address: str, geolocator: Optional[object] = None) -> Optional[Tuple[float, float, dict]]:
+def geocode_address(
+    address: str,
+    geolocator: Optional[object] = None,
+    session: Optional[requests.Session] = None,
+) -> Optional[Tuple[float, float, dict]]:
     """Geocode an address or place name using the Nominatim HTTP API.
 
     Returns a tuple of (latitude, longitude, raw_json) or None if not found.
     This function makes an HTTP request to the public Nominatim service and
     should be used sparingly to respect usage limits.  No API key is required.
+    Pass a ``session`` when geocoding in a loop to reuse its connection.
     """
     try:
         params = {
@@ -53,7 +58,9 @@ def geocode_address(address: str, geolocator: Optional[object] = None) -> Option
             "addressdetails": 1,
         }
         headers = {"User-Agent": GEOCODER_USER_AGENT}
-        resp = requests.get("https://nominatim.openstreetmap.org/search", params=params, headers=headers, timeout=10)
+        resp = (session or requests).get(
+            "https://nominatim.openstreetmap.org/search", params=params, headers=headers, timeout=10
+        )
         if resp.status_code != 200:
             return None
         results = resp.json()
@@ -79,6 +86,16 @@ def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     return R * c
 
 
+def haversine_miles(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """Vectorized haversine distance in miles; arguments broadcast like NumPy arrays."""
+    R = 3958.8
+    phi1, phi2 = np.radians(lat1), np.radians(lat2)
+    dphi = phi2 - phi1
+    dlambda = np.radians(lon2) - np.radians(lon1)
+    a = np.sin(dphi / 2) ** 2 + np.cos(phi1) * np.cos(phi2) * np.sin(dlambda / 2) ** 2
+    return 2 * R * np.arcsin(np.sqrt(a))
+
+
 def classify_band(value: float, bands: Dict[str, Tuple[float, float]]) -> str:
     """Classify a numeric value into a band defined by ranges.
 
@@ -88,3 +105,16 @@ def classify_band(value: float, bands: Dict[str, Tuple[float, float]]) -> str:
         if lower <= value < upper:
             return band
     return "Unknown"
+
+
+def classify_bands(values: pd.Series, bands: Dict[str, Tuple[float, float]]) -> pd.Series:
+    """Vectorized classify_band for a whole Series.
+
+    The bands must be contiguous and in ascending order, as BAND_MILES and
+    BAND_DRIVE are.  Missing or out-of-range values become "Unknown".  The
+    result is categorical (the band keys plus "Unknown"), so comparisons and
+    groupbys on it work on integer codes.
+    """
+    edges = [lower for lower, _ in bands.values()] + [list(bands.values())[-1][1]]
+    binned = pd.cut(values, bins=edges, labels=list(bands), right=False)
+    return binned.cat.add_categories("Unknown").fillna("Unknown")